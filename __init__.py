@@ -22,13 +22,12 @@ from homeassistant.helpers import entity_registry as er
 
 from .const import CONF_ADJACENT_ROOMS, DOMAIN
 from .coordinator import DynamicPresenceCoordinator
+from .presence_control import DATA_OCCUPIED_ROOMS, async_rebuild_reverse_adjacency
 
 PLATFORMS = [
     Platform.BINARY_SENSOR,
-    Platform.NUMBER,
     Platform.SENSOR,
     Platform.SWITCH,
-    Platform.TIME,
 ]
 
 logInit = logging.getLogger("dynamic_presence.init")
@@ -40,6 +39,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     await coordinator.async_config_entry_first_refresh()
 
     hass.data.setdefault(DOMAIN, {})[entry.entry_id] = coordinator
+    async_rebuild_reverse_adjacency(hass)
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
@@ -78,6 +78,8 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
     if unload_ok:
         hass.data[DOMAIN].pop(entry.entry_id, None)
+        hass.data.get(DATA_OCCUPIED_ROOMS, set()).discard(entry.entry_id)
+        async_rebuild_reverse_adjacency(hass)
 
     return unload_ok
 
@@ -102,6 +104,9 @@ async def _async_update_listener(hass: HomeAssistant, entry: ConfigEntry) -> Non
 
     # Update coordinator
     coordinator.update_from_options(entry)
+    async_rebuild_reverse_adjacency(hass)
+    # Resync a running timer with any changed timeout
+    coordinator.presence_control.update_timers()
 
     if (
         coordinator.has_night_mode != had_night_mode
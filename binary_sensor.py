@@ -68,10 +68,14 @@ class DynamicPresenceBinarySensor(  # pylint: disable=abstract-method
         self._attr_suggested_object_id = key
         self._attr_translation_key = key
         self._key = key
+        self._data_key = f"binary_sensor_{key}"
         self._attr_device_class = device_class
         self._attr_device_info = coordinator.device_info
 
     @property
     def is_on(self) -> bool | None:
         """Return true if occupied."""
-        return self.coordinator.data.get(f"binary_sensor_{self._key}")
+        data = self.coordinator.data
+        if data is None:
+            return None
+        return data.get(self._data_key)
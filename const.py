@@ -42,6 +42,9 @@ DEFAULT_LIGHT_THRESHOLD = 100  # lux
 DEFAULT_NIGHT_MODE_START = "23:00:00"
 DEFAULT_NIGHT_MODE_END = "08:00:00"
 
+# Window for coalescing bursts of presence sensor events
+PRESENCE_DEBOUNCE_COOLDOWN = 0.1  # seconds
+
 # Default sensor values
 DEFAULT_SENSOR_OCCUPANCY_DURATION = 0
 DEFAULT_SENSOR_ABSENCE_DURATION = 0
@@ -1,6 +1,6 @@
 """Coordinator for Dynamic Presence integration."""
 
-from datetime import timedelta
+from datetime import time, timedelta
 import logging
 from typing import Any, Dict
 
@@ -16,11 +16,12 @@ from homeassistant.util import dt as dt_util
 from homeassistant.const import STATE_ON
 
 from .light_control import LightController
-from .presence_control import PresenceControl, RoomState
+from .presence_control import ACTIVE_STATES, PresenceControl, RoomState
 from .storage_collection import DynamicPresenceStorage
 from .const import (
     DEFAULT_BINARY_SENSOR_OCCUPANCY,
     DOMAIN,
+    CONF_ADJACENT_ROOMS,
     CONF_PRESENCE_SENSOR,
     CONF_LIGHTS,
     CONF_NIGHT_LIGHTS,
@@ -68,6 +69,11 @@ class MessageFilter(logging.Filter):
 logCoordinator = logging.getLogger("dynamic_presence.coordinator")
 logCoordinator.addFilter(MessageFilter("Finished fetching", "Manually updated"))
 
+UPDATE_INTERVAL = timedelta(seconds=1)
+
+# Errors raised while reacting to entity changes
+COORDINATOR_ERRORS = (HomeAssistantError, ServiceNotFound, TemplateError)
+
 
 class DynamicPresenceCoordinator(DataUpdateCoordinator):
     """Coordinator for room presence management."""
@@ -80,7 +86,7 @@ class DynamicPresenceCoordinator(DataUpdateCoordinator):
             hass,
             logger=logCoordinator,
             name=DOMAIN,
-            update_interval=timedelta(seconds=1),
+            update_interval=UPDATE_INTERVAL,
         )
 
         # 2. Core attributes
@@ -112,6 +118,7 @@ class DynamicPresenceCoordinator(DataUpdateCoordinator):
 
         # Add to existing initialization
         self._last_light_context_id = None
+        self._presence_push_scheduled = False
 
     def _init_config_attributes(self) -> None:
         """Initialize configuration attributes with defaults."""
@@ -121,10 +128,16 @@ class DynamicPresenceCoordinator(DataUpdateCoordinator):
         self._light_sensor = None
         self._night_mode_start = DEFAULT_NIGHT_MODE_START
         self._night_mode_end = DEFAULT_NIGHT_MODE_END
+        self._night_start_time: time | None = None
+        self._night_end_time: time | None = None
         self._detection_timeout = DEFAULT_DETECTION_TIMEOUT
         self._long_timeout = DEFAULT_LONG_TIMEOUT
         self._short_timeout = DEFAULT_SHORT_TIMEOUT
         self._light_threshold = DEFAULT_LIGHT_THRESHOLD
+        self._countdown_timeout = DEFAULT_LONG_TIMEOUT
+        self._active_lights = []
+        self._adjacent_rooms = []
+        self._all_lights = []
 
     def _get_default_data(self) -> dict[str, Any]:
         """Get default runtime data."""
@@ -188,11 +201,26 @@ class DynamicPresenceCoordinator(DataUpdateCoordinator):
         """Get short timeout value."""
         return self._short_timeout
 
+    @property
+    def countdown_timeout(self) -> int:
+        """Get the countdown duration for the current mode."""
+        return self._countdown_timeout
+
     @property
     def light_threshold(self) -> int:
         """Get light threshold value."""
         return self._light_threshold
 
+    @property
+    def all_lights(self) -> list[str]:
+        """Get main and night lights combined, without duplicates."""
+        return self._all_lights
+
+    @property
+    def adjacent_rooms(self) -> list[str]:
+        """Get the entry IDs of adjacent rooms."""
+        return self._adjacent_rooms
+
     @property
     def has_night_mode(self) -> bool:
         """Check if night mode is configured."""
@@ -290,6 +318,11 @@ class DynamicPresenceCoordinator(DataUpdateCoordinator):
                 self._presence_control.handle_presence_event,
             )
         )
+        self.entry.async_on_unload(
+            self._presence_control.presence_debouncer.async_cancel
+        )
+        # Timers outlive the entry on the shared heap unless cancelled here
+        self.entry.async_on_unload(self._presence_control.async_unload)
 
         active_lights = self.lights + self.night_lights
         for light in active_lights:
@@ -305,17 +338,7 @@ class DynamicPresenceCoordinator(DataUpdateCoordinator):
     @property
     def active_lights(self) -> list:
         """Get the currently active light set based on mode."""
-        # First check if night mode is configured
-        if not self.has_night_mode:
-            return self.lights
-
-        # If night mode is configured, check if it's currently active
-        # (requires both night mode switch ON and within night time hours)
-        return (
-            self.night_lights
-            if self.data.get("binary_sensor_night_mode", False)
-            else self.lights
-        )
+        return self._active_lights
 
     @property
     def manual_states(self) -> dict:
@@ -327,22 +350,6 @@ class DynamicPresenceCoordinator(DataUpdateCoordinator):
             }
         return self._manual_states
 
-    @property
-    def switch_state(self, switch_id: str) -> bool:
-        """Get switch state.
-
-        Args:
-            switch_id: The switch identifier to check
-
-        Returns:
-            bool: True if switch is on, False otherwise
-        """
-        switch_entity = self.entry.options.get(switch_id)
-        if not switch_entity:
-            return False
-        state = self.hass.states.get(switch_entity)
-        return state is not None and state.state == "on"
-
     # 3. Manual State Management
     async def _async_light_changed(self, event) -> None:
         """Handle light state changes."""
@@ -354,17 +361,18 @@ class DynamicPresenceCoordinator(DataUpdateCoordinator):
         if not new_state or not old_state:
             return
 
-        logCoordinator.debug(
-            "Light changed: entity=%s, old=%s->%s, time=%s",
-            entity_id,
-            old_state.state if old_state else None,
-            new_state.state if new_state else None,
-            dt_util.utcnow(),
-        )
+        if logCoordinator.isEnabledFor(logging.DEBUG):
+            logCoordinator.debug(
+                "Light changed: entity=%s, old=%s->%s, time=%s",
+                entity_id,
+                old_state.state,
+                new_state.state,
+                dt_util.utcnow(),
+            )
 
-        if self._presence_control.state == RoomState.OCCUPIED:
+        room_state = self._presence_control.state
+        if room_state == RoomState.OCCUPIED:
             try:
-                new_state = event.data.get("new_state")
                 if new_state is not None:
                     is_on = new_state.state == STATE_ON
 
@@ -382,16 +390,18 @@ class DynamicPresenceCoordinator(DataUpdateCoordinator):
                     elif mode == "main" and entity_id in self.lights:
                         self._manual_states["main"][entity_id] = is_on
 
-                    await self._store.async_save()
-                    await self.async_refresh()
-            except (HomeAssistantError, ServiceNotFound, TemplateError) as err:
+                    self._store.async_schedule_save()
+                    # Manual states live outside coordinator.data, so just
+                    # notify listeners instead of running a full refresh
+                    self.async_update_listeners()
+            except COORDINATOR_ERRORS as err:
                 logCoordinator.error(
                     "Error handling light change for %s: %s",
                     entity_id,
                     err,
                     exc_info=True,
                 )
-        elif self._presence_control.state == RoomState.VACANT:
+        elif room_state == RoomState.VACANT:
             # If light turned ON while room is vacant, start countdown
             if new_state.state == STATE_ON:
                 logCoordinator.debug(
@@ -400,21 +410,6 @@ class DynamicPresenceCoordinator(DataUpdateCoordinator):
                 )
                 await self._presence_control.start_countdown_from_vacant()
 
-    async def _apply_light_states(self) -> None:
-        """Apply stored light states or turn on lights."""
-        active_lights = self.active_lights
-        if not active_lights:
-            return
-        await self.light_controller.turn_on_lights(active_lights)
-
-    # 4. Light Control
-    async def _turn_off_lights(self) -> None:
-        """Turn off all active lights."""
-        active_lights = self.active_lights
-        if not active_lights:
-            return
-        await self.light_controller.turn_off_lights(active_lights)
-
     # 5. Configuration and Options
     @callback
     def update_from_options(self, entry: ConfigEntry | dict) -> None:
@@ -444,6 +439,15 @@ class DynamicPresenceCoordinator(DataUpdateCoordinator):
                 self._manual_states["night"] = {
                     light: True for light in self._night_lights
                 }
+        # Parse night hours once; is_night_time runs on every update
+        self._night_start_time = (
+            dt_util.parse_time(self._night_mode_start)
+            if self._night_mode_start
+            else None
+        )
+        self._night_end_time = (
+            dt_util.parse_time(self._night_mode_end) if self._night_mode_end else None
+        )
 
         # Light sensor configuration
         self._light_sensor = options.get(CONF_LIGHT_SENSOR)
@@ -458,6 +462,9 @@ class DynamicPresenceCoordinator(DataUpdateCoordinator):
         )
         self._long_timeout = options.get(CONF_LONG_TIMEOUT, DEFAULT_LONG_TIMEOUT)
         self._short_timeout = options.get(CONF_SHORT_TIMEOUT, DEFAULT_SHORT_TIMEOUT)
+        self._adjacent_rooms = options.get(CONF_ADJACENT_ROOMS, [])
+        self._all_lights = list(dict.fromkeys(self._lights + self._night_lights))
+        self._update_night_mode_attributes(self.data)
 
         self._is_configured = bool(self._presence_sensor and self._lights)
 
@@ -469,14 +476,6 @@ class DynamicPresenceCoordinator(DataUpdateCoordinator):
             len(self._night_lights),
         )
 
-    async def async_save_options(self) -> None:
-        """Save manual states to config entry - called during shutdown."""
-        if hasattr(self, "_manual_states") and self._manual_states:
-            new_data = dict(self.entry.data) if self.entry.data else {}
-            new_data.update(self._manual_states)
-
-            self.hass.config_entries.async_update_entry(self.entry, data=new_data)
-
     # 6. Event Handlers
     async def async_entity_changed(
         self, entity_type: str, key: str, value: Any
@@ -495,13 +494,9 @@ class DynamicPresenceCoordinator(DataUpdateCoordinator):
             # Save to storage
             if entity_type == "switch":
                 self._store.set_state(data_key, value)
-                await self._store.async_save()
-
-            # Update timers if needed
-            if entity_type == "number":
-                await self._presence_control.update_timers(entity_type, key)
+                self._store.async_schedule_save()
 
-        except (HomeAssistantError, ServiceNotFound, TemplateError) as err:
+        except COORDINATOR_ERRORS as err:
             logCoordinator.error(
                 "Error updating %s.%s to %s: %s",
                 entity_type,
@@ -511,95 +506,6 @@ class DynamicPresenceCoordinator(DataUpdateCoordinator):
                 exc_info=True,
             )
 
-    async def async_handle_state_changed(self, new_state: RoomState) -> None:
-        """Public method to handle state changes."""
-        await self._handle_state_changed(new_state)
-
-    async def _handle_state_changed(self, new_state: RoomState) -> None:
-        """Handle room state changes."""
-        if new_state == RoomState.OCCUPIED:
-            # First check light level if sensor configured
-            if self.has_light_sensor:
-                current_light_level = self.data.get("sensor_light_level", 0)
-                if current_light_level >= self.light_threshold:
-                    logCoordinator.debug(
-                        "Light level %s above threshold %s - skipping light activation",
-                        current_light_level,
-                        self.light_threshold,
-                    )
-                    return
-            auto_on = self.data.get("switch_auto_on", False)
-            night_manual_on = False
-            is_night_mode = False
-
-            if self.has_night_mode:
-                night_manual_on = self.data.get("switch_night_manual_on", False)
-                is_night_mode = self._presence_control.is_night_mode_active()
-
-            # Don't turn on lights if Night Manual-On is enabled during night mode
-            if not auto_on or (is_night_mode and night_manual_on):
-                logCoordinator.debug(
-                    "Skipping light activation: auto_on=%s, night_mode=%s, night_manual_on=%s",
-                    auto_on,
-                    is_night_mode,
-                    night_manual_on,
-                )
-                return
-
-            mode = "night" if is_night_mode else "main"
-            lights_to_control = self.night_lights if mode == "night" else self.lights
-
-            # Special case: If ALL manual states are OFF, reset them to ON
-            all_lights_off = all(
-                not self._manual_states[mode].get(light, True)
-                for light in lights_to_control
-            )
-
-            if all_lights_off:
-                logCoordinator.debug("All manual states were OFF - resetting to ON")
-                # Reset all manual states to ON
-                for light in lights_to_control:
-                    self._manual_states[mode][light] = True
-                await self._store.async_save()
-                # Turn on all lights
-                await self.light_controller.turn_on_lights(lights_to_control)
-            else:
-                # Normal case: Restore previous manual states
-                logCoordinator.debug("Restoring previous manual states")
-                for light in lights_to_control:
-                    if self._manual_states[mode].get(light, True):
-                        await self.hass.services.async_call(
-                            "light",
-                            "turn_on",
-                            {"entity_id": light},
-                            blocking=True,
-                        )
-
-        elif new_state == RoomState.VACANT:
-            # Check if we should turn off lights based on Auto-Off
-            auto_off = self.data.get("switch_auto_off", False)
-            if not auto_off:
-                logCoordinator.debug("Auto-off disabled - keeping current light states")
-                return
-
-            mode = "night" if self._presence_control.is_night_mode_active() else "main"
-            lights_to_control = self.night_lights if mode == "night" else self.lights
-
-            # Turn off all lights from both sets
-            all_lights = set(self.lights + self.night_lights)
-            for light in all_lights:
-                try:
-                    await self.hass.services.async_call(
-                        "light",
-                        "turn_off",
-                        {"entity_id": light},
-                        blocking=True,
-                    )
-                except ServiceNotFound as err:
-                    logCoordinator.error("Failed to turn off %s: %s", light, err)
-
-        await self.async_refresh()
-
     async def _handle_mode_changed(self, is_night_mode: bool) -> None:
         """Handle transition between normal and night mode."""
         if (
@@ -643,6 +549,32 @@ class DynamicPresenceCoordinator(DataUpdateCoordinator):
         await self.async_refresh()
 
     # 7. Data Updates
+    def _update_presence_data(self, data: Dict[str, Any]) -> None:
+        """Write presence state derived values into data."""
+        current_state = self._presence_control.state
+        data["binary_sensor_occupancy"] = current_state in ACTIVE_STATES
+        data.update(self._presence_control.durations)
+
+    @callback
+    def async_presence_state_changed(self) -> None:
+        """Schedule a push of the room state to listeners.
+
+        Transitions made within the same loop iteration are batched into a
+        single notification carrying the final state.
+        """
+        if self._presence_push_scheduled:
+            return
+        self._presence_push_scheduled = True
+        self.hass.loop.call_soon(self._async_push_presence_state)
+
+    @callback
+    def _async_push_presence_state(self) -> None:
+        """Push presence state to listeners without a full refresh."""
+        self._presence_push_scheduled = False
+        data = self.data.copy()
+        self._update_presence_data(data)
+        self.async_set_updated_data(data)
+
     async def _async_update_data(self) -> Dict[str, Any]:
         """Update data."""
         if not hasattr(self, "_presence_control"):
@@ -650,15 +582,9 @@ class DynamicPresenceCoordinator(DataUpdateCoordinator):
 
         updated_data = self.data.copy()
 
-        # Update state-based sensors
-        current_state = self._presence_control.state
-        updated_data["binary_sensor_occupancy"] = current_state in [
-            RoomState.OCCUPIED,
-            RoomState.DETECTION_TIMEOUT,
-        ]
-
-        # Update durations
-        updated_data.update(self._presence_control.durations)
+        # Update state-based sensors and durations
+        self._update_presence_data(updated_data)
+        self._presence_control.log_durations()
 
         # Update light sensor if configured
         if self.light_sensor:
@@ -677,17 +603,33 @@ class DynamicPresenceCoordinator(DataUpdateCoordinator):
         switch_on = bool(self.data.get("switch_night_mode", False))
         is_night_time = self.is_night_time()
         updated_data["binary_sensor_night_mode"] = switch_on and is_night_time
+        self._update_night_mode_attributes(updated_data)
 
         return updated_data
 
     # 8. Night Mode Management
+    def _update_night_mode_attributes(self, data: Dict[str, Any]) -> None:
+        """Resolve the mode dependent light set and countdown for data.
+
+        Night mode only applies when night lights are configured and the
+        night mode binary sensor (switch ON and within night hours) is on.
+        """
+        if self._night_lights and data.get("binary_sensor_night_mode", False):
+            self._active_lights = self._night_lights
+            self._countdown_timeout = self._short_timeout
+        else:
+            self._active_lights = self._lights
+            self._countdown_timeout = self._long_timeout
+
     def is_night_mode_active(self) -> bool:
         """Check if night mode is active for light control."""
         return bool(self.data.get("binary_sensor_night_mode", False))
 
     def is_night_time(self) -> bool:
         """Check if current time is within night time hours."""
-        if not self.night_mode_start or not self.night_mode_end:
+        start_time = self._night_start_time
+        end_time = self._night_end_time
+        if start_time is None or end_time is None:
             logCoordinator.debug(
                 "Night time check - No times configured: start=%s, end=%s",
                 self.night_mode_start,
@@ -696,8 +638,6 @@ class DynamicPresenceCoordinator(DataUpdateCoordinator):
             return False
 
         current_time = dt_util.now().time()
-        start_time = dt_util.parse_time(self.night_mode_start)
-        end_time = dt_util.parse_time(self.night_mode_end)
 
         # For overnight periods (e.g., 20:00 to 08:00)
         if start_time > end_time:
@@ -708,24 +648,3 @@ class DynamicPresenceCoordinator(DataUpdateCoordinator):
             is_night = start_time <= current_time <= end_time
 
         return is_night
-
-    def _check_night_mode_switch(self) -> bool:
-        """Check if night mode is forced by switch."""
-        switch_state = bool(self.data.get("switch_night_mode", False))
-        logCoordinator.debug("Night mode switch state: %s", switch_state)
-        return switch_state
-
-    async def handle_mode_change(self) -> None:
-        """Handle transition between normal and night mode."""
-        is_night_mode = self.is_night_mode_active()
-        lights_to_control = self.night_lights if is_night_mode else self.lights
-
-        if self._presence_control.state == RoomState.OCCUPIED:
-            await self.light_controller.update_active_lights(
-                is_night_mode,
-                lights_to_control,
-                self._manual_states,
-                self.has_night_mode,
-            )
-
-        await self.async_refresh()
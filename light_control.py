@@ -21,14 +21,13 @@ class LightController:
     # 2. Light State Checks
     def check_any_lights_on(self, lights: List[str]) -> bool:
         """Check if any of the specified lights are on."""
-        for light in lights:
-            try:
-                state = self.hass.states.get(light)
-                if state and state.state == STATE_ON:
-                    return True
-            except HomeAssistantError as err:
-                logLightController.error("Error checking light state: %s", err)
-        return False
+        is_state = self.hass.states.is_state
+        return any(is_state(light, STATE_ON) for light in lights)
+
+    def get_lights_on(self, lights: List[str]) -> List[str]:
+        """Get the subset of the specified lights that are on."""
+        is_state = self.hass.states.is_state
+        return [light for light in lights if is_state(light, STATE_ON)]
 
     def get_light_state(self, light: str) -> Optional[bool]:
         """Get state of a specific light."""
@@ -70,29 +69,3 @@ class LightController:
             logLightController.debug("Turning off lights: %s", lights)
         except ServiceNotFound as err:
             logLightController.error("Failed to turn off lights: %s", err)
-
-    async def update_active_lights(
-        self,
-        is_night_mode: bool,
-        lights_to_control: list,
-        manual_states: dict,
-        has_night_mode: bool,
-    ) -> None:
-        """Update which lights are active based on mode."""
-        # Turn off lights that aren't in the new mode's set
-        all_lights = set(lights_to_control)
-        for light in all_lights:
-            if light not in lights_to_control:
-                await self.turn_off_lights([light])
-
-        # Use night mode only if it's configured and active
-        mode = "main"
-        if has_night_mode and is_night_mode:
-            mode = "night"
-
-        # Turn on lights according to their manual states
-        lights_to_turn_on = [
-            light for light in lights_to_control if manual_states[mode].get(light, True)
-        ]
-        if lights_to_turn_on:
-            await self.turn_on_lights(lights_to_turn_on)
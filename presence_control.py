@@ -1,16 +1,26 @@
 """State machine for Dynamic Presence integration."""
 
-from enum import Enum
+import asyncio
+from enum import IntEnum
+from functools import partial
+import heapq
+import itertools
 import logging
 from typing import Dict, Any, TYPE_CHECKING
 
 
-from homeassistant.core import callback
+from homeassistant.core import HassJob, callback
 from homeassistant.exceptions import HomeAssistantError, ServiceNotFound
-from homeassistant.helpers.event import async_call_later
-from homeassistant.util import dt as dt_util
+from homeassistant.helpers.debounce import Debouncer
 
-from .const import CONF_ADJACENT_ROOMS, DOMAIN
+from .const import (
+    DOMAIN,
+    PRESENCE_DEBOUNCE_COOLDOWN,
+    STATE_COUNTDOWN,
+    STATE_DETECTION_TIMEOUT,
+    STATE_OCCUPIED,
+    STATE_VACANT,
+)
 
 
 if TYPE_CHECKING:
@@ -18,49 +28,204 @@ if TYPE_CHECKING:
 
 logPresenceControl = logging.getLogger("dynamic_presence.presence_control")
 
+DATA_TIMER_MANAGER = f"{DOMAIN}_timer_manager"
+DATA_REVERSE_ADJACENCY = f"{DOMAIN}_reverse_adjacency"
+DATA_OCCUPIED_ROOMS = f"{DOMAIN}_occupied_rooms"
 
-class RoomState(Enum):
+# Interval between periodic duration debug logs
+DURATION_LOG_INTERVAL = 30  # seconds
+
+# Restarting a timer closer than this to its current deadline is a no-op
+TIMER_RESTART_TOLERANCE = 0.05  # seconds
+
+# Errors raised by service calls made from the state machine
+SERVICE_ERRORS = (HomeAssistantError, ServiceNotFound)
+
+
+class RoomState(IntEnum):
     """Room state machine states."""
 
-    VACANT = "vacant"
-    OCCUPIED = "occupied"
-    DETECTION_TIMEOUT = "detection_timeout"
-    COUNTDOWN = "countdown"
+    VACANT = 0
+    OCCUPIED = 1
+    DETECTION_TIMEOUT = 2
+    COUNTDOWN = 3
+
+
+# String form of each state for logging
+ROOM_STATE_NAMES = {
+    RoomState.VACANT: STATE_VACANT,
+    RoomState.OCCUPIED: STATE_OCCUPIED,
+    RoomState.DETECTION_TIMEOUT: STATE_DETECTION_TIMEOUT,
+    RoomState.COUNTDOWN: STATE_COUNTDOWN,
+}
+
+
+# States in which the room counts as occupied / absent
+ACTIVE_STATES = frozenset({RoomState.OCCUPIED, RoomState.DETECTION_TIMEOUT})
+IDLE_STATES = frozenset({RoomState.COUNTDOWN, RoomState.VACANT})
+
+# Allowed state machine transitions as (from, to) pairs
+VALID_TRANSITIONS = frozenset(
+    {
+        (RoomState.VACANT, RoomState.OCCUPIED),
+        # A light turned on in a vacant room
+        (RoomState.VACANT, RoomState.COUNTDOWN),
+        (RoomState.OCCUPIED, RoomState.DETECTION_TIMEOUT),
+        (RoomState.DETECTION_TIMEOUT, RoomState.OCCUPIED),
+        (RoomState.DETECTION_TIMEOUT, RoomState.COUNTDOWN),
+        # Detection timeout expired with all lights off
+        (RoomState.DETECTION_TIMEOUT, RoomState.VACANT),
+        (RoomState.COUNTDOWN, RoomState.OCCUPIED),
+        (RoomState.COUNTDOWN, RoomState.VACANT),
+    }
+)
+
+TIMER_DETECTION = "detection"
+TIMER_COUNTDOWN = "countdown"
+
+# State a timer must still be in for its expiry to be acted on
+TIMER_STATES = {
+    TIMER_DETECTION: RoomState.DETECTION_TIMEOUT,
+    TIMER_COUNTDOWN: RoomState.COUNTDOWN,
+}
+
+
+@callback
+def async_rebuild_reverse_adjacency(hass) -> None:
+    """Index, for every room, the rooms that list it as adjacent.
+
+    Must be called whenever a room is set up, unloaded or reconfigured.
+    """
+    reverse: dict[str, set[str]] = {}
+    for entry_id, coordinator in hass.data.get(DOMAIN, {}).items():
+        for room_id in coordinator.adjacent_rooms:
+            if room_id != entry_id:
+                reverse.setdefault(room_id, set()).add(entry_id)
+    hass.data[DATA_REVERSE_ADJACENCY] = reverse
+
+
+class PresenceTimerManager:
+    """Shared deadline heap driving every presence timer on the event loop.
+
+    Instead of allocating a new ``async_call_later`` handle each time a timer
+    restarts, all timers push ``(deadline, seq, timer, generation)`` entries
+    onto one heap and a single loop handle is kept armed for the earliest
+    deadline. Cancelled or restarted timers are dropped lazily when popped.
+    """
+
+    def __init__(self, hass) -> None:
+        """Initialize timer manager."""
+        self._hass = hass
+        self._loop = hass.loop
+        self._heap: list[tuple[float, int, "PresenceTimer", int]] = []
+        self._seq = itertools.count()
+        self._wake_handle: asyncio.TimerHandle | None = None
+        self._wake_deadline: float | None = None
+
+    @classmethod
+    def get(cls, hass) -> "PresenceTimerManager":
+        """Return the timer manager shared by all rooms."""
+        manager = hass.data.get(DATA_TIMER_MANAGER)
+        if manager is None:
+            manager = hass.data[DATA_TIMER_MANAGER] = cls(hass)
+        return manager
+
+    def schedule(self, timer: "PresenceTimer", deadline: float) -> None:
+        """Schedule timer to fire at the given loop time."""
+        heapq.heappush(self._heap, (deadline, next(self._seq), timer, timer.generation))
+        if self._wake_deadline is None or deadline < self._wake_deadline:
+            self._arm(deadline)
+
+    def discard_stale(self) -> None:
+        """Drop cancelled and restarted timers from the heap right away.
+
+        Lazy deletion leaves them until their deadline, which would keep an
+        unloaded room's objects referenced until then.
+        """
+        heap = self._heap
+        heap[:] = [entry for entry in heap if entry[2].generation == entry[3]]
+        heapq.heapify(heap)
+        if not heap and self._wake_handle is not None:
+            self._wake_handle.cancel()
+            self._wake_handle = None
+            self._wake_deadline = None
+
+    def _arm(self, deadline: float) -> None:
+        """Arm the single wake-up handle for the given deadline."""
+        if self._wake_handle is not None:
+            self._wake_handle.cancel()
+        self._wake_deadline = deadline
+        self._wake_handle = self._loop.call_at(deadline, self._wake, deadline)
+
+    @callback
+    def _wake(self, armed_deadline: float) -> None:
+        """Fire all timers whose deadline has passed."""
+        self._wake_handle = None
+        self._wake_deadline = None
+        heap = self._heap
+        # The loop may run a handle marginally before its deadline
+        now = max(self._loop.time(), armed_deadline)
+        while heap and heap[0][0] <= now:
+            _deadline, _seq, timer, generation = heapq.heappop(heap)
+            if timer.generation == generation and timer.is_active:
+                timer.fire()
+
+        # Drop stale entries so the wake handle tracks a live deadline
+        while heap and heap[0][2].generation != heap[0][3]:
+            heapq.heappop(heap)
+        if heap:
+            self._arm(heap[0][0])
 
 
 class PresenceTimer:
     """Timer management for presence detection."""
 
+    __slots__ = (
+        "_hass",
+        "_job",
+        "_clock",
+        "_logger",
+        "_manager",
+        "_deadline",
+        "_duration",
+        "generation",
+    )
+
     def __init__(self, hass, callback_method, logger) -> None:
         """Initialize timer."""
         self._hass = hass
-        self._callback = callback_method
+        self._job = HassJob(callback_method)
+        self._clock = hass.loop.time
         self._logger = logger
-        self._timer = None
-        self._start_time = None
-        self._duration = None
+        self._manager = PresenceTimerManager.get(hass)
+        self._deadline = None
+        self._duration: float | None = None
+        self.generation = 0
 
     @property
     def is_active(self) -> bool:
         """Check if timer is currently active."""
-        return self._timer is not None
+        return self._deadline is not None
+
+    @property
+    def duration(self) -> float | None:
+        """Get the duration the timer was last started with."""
+        return self._duration
 
     @property
     def remaining_time(self) -> float:
         """Get remaining time in seconds."""
-        if not self.is_active or not self._start_time:
+        if self._deadline is None:
             return 0
-        elapsed = (dt_util.utcnow() - self._start_time).total_seconds()
-        return max(0, self._duration - elapsed)
+        return max(0, self._deadline - self._clock())
 
     def cancel(self) -> None:
         """Cancel the timer."""
-        if self._timer:
-            self._timer()
-            self._timer = None
-            self._start_time = None
-            self._duration = None
-            self._logger.debug("Timer cancelled")
+        if self._deadline is not None:
+            self._deadline = None
+            self.generation += 1
+            if self._logger.isEnabledFor(logging.DEBUG):
+                self._logger.debug("Timer cancelled")
 
     def start(self, duration: float) -> None:
         """Start the timer."""
@@ -68,16 +233,47 @@ class PresenceTimer:
             self._logger.warning("Invalid timer duration: %s", duration)
             return
 
+        deadline = self._clock() + duration
+        if (
+            self._deadline is not None
+            and abs(deadline - self._deadline) < TIMER_RESTART_TOLERANCE
+        ):
+            # Already armed for (practically) the same deadline
+            return
+
         self.cancel()
-        self._start_time = dt_util.utcnow()
+        self._deadline = deadline
         self._duration = duration
-        self._timer = async_call_later(self._hass, duration, self._callback)
-        self._logger.debug("Timer started for %s seconds", duration)
+        self._manager.schedule(self, deadline)
+        if self._logger.isEnabledFor(logging.DEBUG):
+            self._logger.debug("Timer started for %s seconds", duration)
+
+    @callback
+    def fire(self) -> None:
+        """Run the timer callback once its deadline is reached."""
+        self._deadline = None
+        self.generation += 1
+        self._hass.async_run_hass_job(self._job)
 
 
 class PresenceControl:
     """Presence state machine controller."""
 
+    __slots__ = (
+        "coordinator",
+        "hass",
+        "_clock",
+        "_state",
+        "_last_presence_time",
+        "_occupancy_start_time",
+        "_next_duration_log",
+        "_durations",
+        "_timers",
+        "_countdown_subtracts_detection",
+        "_pending_presence_state",
+        "_presence_debouncer",
+    )
+
     # 1. Core Initialization
     def __init__(
         self,
@@ -86,16 +282,31 @@ class PresenceControl:
         """Initialize the presence controller."""
         self.coordinator = coordinator
         self.hass = coordinator.hass
+        self._clock = self.hass.loop.time
         self._state = RoomState.VACANT
-        self._switches = {}
-        self._last_presence_time = None
-        self._occupancy_start_time = None
-        self._last_logged_state = None
-        self._detection_timer = PresenceTimer(
-            self.hass, self._detection_timer_finished, logPresenceControl
-        )
-        self._countdown_timer = PresenceTimer(
-            self.hass, self._countdown_timer_finished, logPresenceControl
+        # Loop (monotonic) timestamps; only elapsed seconds are ever needed
+        self._last_presence_time: float | None = None
+        self._occupancy_start_time: float | None = None
+        self._next_duration_log: float | None = None
+        self._durations = {
+            "sensor_occupancy_duration": 0,
+            "sensor_absence_duration": 0,
+        }
+        # Whether the running countdown continues on from detection_timeout
+        self._countdown_subtracts_detection = True
+        self._timers = {
+            kind: PresenceTimer(
+                self.hass, partial(self._timer_finished, kind), logPresenceControl
+            )
+            for kind in TIMER_STATES
+        }
+        self._pending_presence_state: str | None = None
+        self._presence_debouncer = Debouncer(
+            self.hass,
+            logPresenceControl,
+            cooldown=PRESENCE_DEBOUNCE_COOLDOWN,
+            immediate=False,
+            function=self._async_process_presence_state,
         )
 
     # 2. Properties
@@ -105,39 +316,72 @@ class PresenceControl:
         """Return current state."""
         return self._state
 
+    @property
+    def presence_debouncer(self) -> Debouncer:
+        """Return the debouncer coalescing presence sensor events."""
+        return self._presence_debouncer
+
     @property
     @callback
     def durations(self) -> Dict[str, Any]:
-        """Get current duration values."""
-        current_time = dt_util.utcnow()
-        durations = {
-            "sensor_occupancy_duration": 0,
-            "sensor_absence_duration": 0,
-        }
+        """Get current duration values.
+
+        The same dict is updated in place and returned on every call; callers
+        must copy it before mutating.
+        """
+        durations = self._durations
+        if self._occupancy_start_time is None and self._last_presence_time is None:
+            # Nothing detected since startup; both durations are still zero
+            return durations
+
+        current_time = self._clock()
+        state = self._state
 
-        if self._occupancy_start_time and self.state in [
-            RoomState.OCCUPIED,
-            RoomState.DETECTION_TIMEOUT,
-        ]:
+        if self._occupancy_start_time is not None and state in ACTIVE_STATES:
             durations["sensor_occupancy_duration"] = int(
-                (current_time - self._occupancy_start_time).total_seconds()
+                current_time - self._occupancy_start_time
             )
+        else:
+            durations["sensor_occupancy_duration"] = 0
 
-        if self._last_presence_time and self.state in [
-            RoomState.COUNTDOWN,
-            RoomState.VACANT,
-        ]:
+        if self._last_presence_time is not None and state in IDLE_STATES:
             durations["sensor_absence_duration"] = int(
-                (current_time - self._last_presence_time).total_seconds()
+                current_time - self._last_presence_time
             )
-
-        if (
-            durations["sensor_occupancy_duration"] % 30 == 0
-        ) or self._last_logged_state != self.state:
-            self._last_logged_state = self.state
+        else:
+            durations["sensor_absence_duration"] = 0
 
         return durations
 
+    @callback
+    def log_durations(self) -> None:
+        """Log the last computed durations at a fixed interval.
+
+        Called from the coordinator's periodic update so reading durations
+        stays free of side effects.
+        """
+        if not logPresenceControl.isEnabledFor(logging.DEBUG):
+            return
+
+        current_time = self._clock()
+        next_log = self._next_duration_log
+        if next_log is None:
+            self._next_duration_log = current_time + DURATION_LOG_INTERVAL
+            return
+        if current_time < next_log:
+            return
+
+        logPresenceControl.debug(
+            "Room state %s - occupancy: %ss, absence: %ss",
+            ROOM_STATE_NAMES[self._state],
+            self._durations["sensor_occupancy_duration"],
+            self._durations["sensor_absence_duration"],
+        )
+        # Advance on the fixed grid so missed reads don't shift the schedule
+        while next_log <= current_time:
+            next_log += DURATION_LOG_INTERVAL
+        self._next_duration_log = next_log
+
     @property
     def active_lights(self) -> list:
         """Get currently active light set based on mode."""
@@ -148,228 +392,254 @@ class PresenceControl:
         return self.coordinator.is_night_mode_active()
 
     # 3. State Management
-    async def _update_state(self, new_state: RoomState) -> None:
-        """Update room state."""
-        # Check if automation is enabled
-        if not self.coordinator.data.get("switch_automation", True):
-            logPresenceControl.debug(
-                "Room automation disabled - ignoring state change to %s", new_state
-            )
-            return
+    def _enter_occupied(self, now: float) -> None:
+        """Start the occupancy clock."""
+        self._occupancy_start_time = now
 
-        logPresenceControl.debug(
-            "State transition: %s -> %s",
-            self._state.value if self._state else "None",
-            new_state.value,
-        )
+    def _enter_vacant(self, now: float) -> None:
+        """Stop the occupancy clock."""
+        self._occupancy_start_time = None
 
-        if new_state == RoomState.VACANT:
-            # First check if any room that lists us as adjacent has presence
-            for entry_id, coordinator in self.hass.data[DOMAIN].items():
-                if entry_id == self.coordinator.entry.entry_id:
-                    continue  # Skip self
+    # Bookkeeping run on entering a state, looked up once per transition
+    _ENTRY_ACTIONS = {
+        RoomState.OCCUPIED: _enter_occupied,
+        RoomState.VACANT: _enter_vacant,
+    }
 
-                adjacent_rooms = coordinator.entry.options.get(CONF_ADJACENT_ROOMS, [])
-                if (
-                    self.coordinator.entry.entry_id in adjacent_rooms
-                    and coordinator.presence_control.state == RoomState.OCCUPIED
-                ):
-                    logPresenceControl.debug(
-                        "Room %s has presence and lists us as adjacent, keeping lights on",
-                        coordinator.room_name,
-                    )
-                    # Update state but don't turn off any lights
-                    self._state = new_state
-                    await self.coordinator.async_refresh()
-                    return
+    async def _update_state(
+        self, new_state: RoomState, now: float | None = None
+    ) -> None:
+        """Update room state.
 
-            # No rooms with presence list us as adjacent, proceed with turning off lights
-            auto_off = self.coordinator.data.get("switch_auto_off", False)
-            if auto_off:
-                # Turn off local lights
-                all_lights = set(
-                    self.coordinator.lights + self.coordinator.night_lights
-                )
-                await self.coordinator.light_controller.turn_off_lights(
-                    list(all_lights)
-                )
-                logPresenceControl.debug("Turned off local room lights: %s", all_lights)
+        Args:
+            new_state: State to transition to.
+            now: Loop timestamp the caller already read for this event, if any.
+        """
+        if new_state is self._state:
+            return
 
-                # Turn off lights in our adjacent rooms if they're vacant
-                adjacent_rooms = self.coordinator.entry.options.get(
-                    CONF_ADJACENT_ROOMS, []
-                )
-                for room_id in adjacent_rooms:
-                    coordinator = self.hass.data[DOMAIN].get(room_id)
-                    if (
-                        coordinator
-                        and coordinator.presence_control.state == RoomState.VACANT
-                    ):
-                        await coordinator.light_controller.turn_off_lights(
-                            coordinator.active_lights
-                        )
-                        logPresenceControl.debug(
-                            "Turned off adjacent room %s lights: %s",
-                            coordinator.room_name,
-                            coordinator.active_lights,
-                        )
+        if not self._validate_state_transition(new_state):
+            return
 
-        elif new_state == RoomState.OCCUPIED:
-            auto_on = self.coordinator.data.get("switch_auto_on", False)
-            is_night_mode = (
-                self.coordinator.is_night_mode_active()
-                if self.coordinator.has_night_mode
-                else False
+        # Don't drive lights or push updates while Home Assistant shuts down
+        if self.hass.is_stopping:
+            return
+
+        # Check if automation is enabled
+        if not self.coordinator.data.get("switch_automation", True):
+            logPresenceControl.debug(
+                "Room automation disabled - ignoring state change to %s",
+                ROOM_STATE_NAMES[new_state],
             )
-            night_manual_on = (
-                self.coordinator.data.get("switch_night_manual_on", False)
-                if self.coordinator.has_night_mode
-                else False
+            return
+
+        if logPresenceControl.isEnabledFor(logging.DEBUG):
+            logPresenceControl.debug(
+                "State transition: %s -> %s",
+                ROOM_STATE_NAMES[self._state],
+                ROOM_STATE_NAMES[new_state],
             )
 
-            if auto_on and (not is_night_mode or not night_manual_on):
-                mode = "night" if is_night_mode else "main"
-                lights_to_control = (
-                    self.coordinator.active_lights
-                )  # Use active_lights property to get correct set
+        entry_action = self._ENTRY_ACTIONS.get(new_state)
+        if entry_action is not None:
+            entry_action(self, self._clock() if now is None else now)
 
-                # Check if ALL manual states are OFF
-                all_lights_off = all(
-                    not self.coordinator.manual_states[mode].get(light, True)
-                    for light in lights_to_control
-                )
+        entry_handler = self._ENTRY_HANDLERS.get(new_state)
+        if entry_handler is not None:
+            await entry_handler(self)
 
-                if all_lights_off:
-                    # Reset all manual states to ON
-                    self.coordinator.manual_states[mode] = {
-                        light: True for light in lights_to_control
-                    }
-                    await self.coordinator.light_controller.turn_on_lights(
-                        lights_to_control
-                    )
-                else:
-                    # Only turn on lights that were ON in manual states
-                    lights_to_turn_on = [
-                        light
-                        for light in lights_to_control
-                        if self.coordinator.manual_states[mode].get(light, True)
-                    ]
-                    if lights_to_turn_on:
-                        await self.coordinator.light_controller.turn_on_lights(
-                            lights_to_turn_on
-                        )
+        self._state = new_state
+        occupied_rooms = self.hass.data.setdefault(DATA_OCCUPIED_ROOMS, set())
+        if new_state is RoomState.OCCUPIED:
+            occupied_rooms.add(self.coordinator.entry.entry_id)
+        else:
+            occupied_rooms.discard(self.coordinator.entry.entry_id)
+        self.coordinator.async_presence_state_changed()
 
-            # Then handle adjacent rooms
-            adjacent_rooms = self.coordinator.entry.options.get(CONF_ADJACENT_ROOMS, [])
-            logPresenceControl.debug("Adjacent rooms configured: %s", adjacent_rooms)
+    async def _apply_vacant(self) -> None:
+        """Turn off lights on entering VACANT."""
+        domain_data = self.hass.data.get(DOMAIN, {})
+
+        # First check if any room that lists us as adjacent has presence
+        listing_rooms = self.hass.data.get(DATA_REVERSE_ADJACENCY, {}).get(
+            self.coordinator.entry.entry_id, ()
+        )
+        occupied_rooms = self.hass.data.get(DATA_OCCUPIED_ROOMS, set())
+        if not occupied_rooms.isdisjoint(listing_rooms):
+            logPresenceControl.debug(
+                "A room listing us as adjacent has presence, keeping lights on"
+            )
+            # Don't turn off any lights
+            return
 
-            for room_id in adjacent_rooms:
-                coordinator = self.hass.data[DOMAIN].get(room_id)
+        # No rooms with presence list us as adjacent, proceed with turning off lights
+        auto_off = self.coordinator.data.get("switch_auto_off", False)
+        if auto_off:
+            # Turn off local lights, skipping any that are already off
+            light_controller = self.coordinator.light_controller
+            lights_on = light_controller.get_lights_on(self.coordinator.all_lights)
+            await light_controller.turn_off_lights(lights_on)
+            logPresenceControl.debug("Turned off local room lights: %s", lights_on)
+
+            # Turn off lights in our adjacent rooms if they're vacant
+            debug = logPresenceControl.isEnabledFor(logging.DEBUG)
+            calls = []
+            for room_id in self.coordinator.adjacent_rooms:
+                coordinator = domain_data.get(room_id)
                 if (
                     coordinator
                     and coordinator.presence_control.state == RoomState.VACANT
                 ):
-                    # Check if automation is enabled for adjacent room
-                    if not coordinator.data.get("switch_automation", True):
+                    adjacent_lights = coordinator.active_lights
+                    if debug:
+                        logPresenceControl.debug(
+                            "Turning off adjacent room %s lights: %s",
+                            coordinator.room_name,
+                            adjacent_lights,
+                        )
+                    calls.append(
+                        coordinator.light_controller.turn_off_lights(adjacent_lights)
+                    )
+            await self._async_run_adjacent_calls(calls)
+
+    async def _apply_occupied(self) -> None:
+        """Turn on lights on entering OCCUPIED."""
+        data = self.coordinator.data
+        auto_on = data.get("switch_auto_on", False)
+        is_night_mode = night_manual_on = False
+        if self.coordinator.has_night_mode:
+            is_night_mode = self.coordinator.is_night_mode_active()
+            night_manual_on = data.get("switch_night_manual_on", False)
+
+        if auto_on and (not is_night_mode or not night_manual_on):
+            mode = "night" if is_night_mode else "main"
+            lights_to_control = (
+                self.coordinator.active_lights
+            )  # Use active_lights property to get correct set
+
+            # Only turn on lights that were ON in manual states
+            all_manual_states = self.coordinator.manual_states
+            manual_states = all_manual_states[mode]
+            lights_to_turn_on = [
+                light for light in lights_to_control if manual_states.get(light, True)
+            ]
+
+            if not lights_to_turn_on:
+                # All manual states are OFF: reset them to ON
+                all_manual_states[mode] = dict.fromkeys(lights_to_control, True)
+                lights_to_turn_on = lights_to_control
+
+            await self.coordinator.light_controller.turn_on_lights(lights_to_turn_on)
+
+        # Then handle adjacent rooms
+        adjacent_rooms = self.coordinator.adjacent_rooms
+        debug = logPresenceControl.isEnabledFor(logging.DEBUG)
+        if debug:
+            logPresenceControl.debug("Adjacent rooms configured: %s", adjacent_rooms)
+
+        domain_data = self.hass.data.get(DOMAIN, {})
+        calls = []
+        for room_id in adjacent_rooms:
+            coordinator = domain_data.get(room_id)
+            if coordinator and coordinator.presence_control.state == RoomState.VACANT:
+                # Check if automation is enabled for adjacent room
+                if not coordinator.data.get("switch_automation", True):
+                    if debug:
                         logPresenceControl.debug(
                             "Adjacent room %s has automation disabled - skipping",
                             coordinator.room_name,
                         )
-                        continue
+                    continue
 
-                    if coordinator.has_light_sensor:
-                        light_level = coordinator.data.get("sensor_light_level", 0)
+                if coordinator.has_light_sensor:
+                    light_level = coordinator.data.get("sensor_light_level", 0)
+                    light_threshold = coordinator.light_threshold
+                    if debug:
                         logPresenceControl.debug(
                             "Adjacent room %s light level: %s (threshold: %s)",
                             room_id,
                             light_level,
-                            coordinator.light_threshold,
+                            light_threshold,
                         )
-                        if light_level >= coordinator.light_threshold:
-                            continue
+                    if light_level >= light_threshold:
+                        continue
 
-                    lights_to_control = coordinator.active_lights
+                lights_to_control = coordinator.active_lights
+                if debug:
                     logPresenceControl.debug(
                         "Turning on adjacent room %s lights: %s",
                         room_id,
                         lights_to_control,
                     )
-                    await coordinator.light_controller.turn_on_lights(lights_to_control)
-
-        elif new_state == RoomState.VACANT:
-            # Handle local room first #
-            auto_off = self.coordinator.data.get("switch_auto_off", False)
-            if auto_off:
-                all_lights = set(
-                    self.coordinator.lights + self.coordinator.night_lights
-                )
-                await self.coordinator.light_controller.turn_off_lights(
-                    list(all_lights)
+                calls.append(
+                    coordinator.light_controller.turn_on_lights(lights_to_control)
                 )
-                logPresenceControl.debug("Turned off local room lights: %s", all_lights)
+        await self._async_run_adjacent_calls(calls)
 
-            # Then clean up adjacent rooms
-            adjacent_rooms = self.coordinator.entry.options.get(CONF_ADJACENT_ROOMS, [])
-            for room_id in adjacent_rooms:
-                coordinator = self.hass.data[DOMAIN].get(room_id)
-                if (
-                    coordinator
-                    and coordinator.presence_control.state == RoomState.VACANT
-                ):
-                    await coordinator.light_controller.turn_off_lights(
-                        coordinator.active_lights
-                    )
+    # Light handling run on entering a state; other states have none
+    _ENTRY_HANDLERS = {
+        RoomState.VACANT: _apply_vacant,
+        RoomState.OCCUPIED: _apply_occupied,
+    }
 
-        self._state = new_state
-        await self.coordinator.async_refresh()
+    async def _async_run_adjacent_calls(self, calls: list) -> None:
+        """Run light calls for adjacent rooms concurrently.
+
+        A service error in one room is logged and doesn't stop the others.
+        """
+        if not calls:
+            return
+        for result in await asyncio.gather(*calls, return_exceptions=True):
+            if isinstance(result, SERVICE_ERRORS):
+                logPresenceControl.warning(
+                    "Error controlling adjacent room lights: %s", result
+                )
+            elif isinstance(result, BaseException):
+                raise result
 
     def _validate_state_transition(self, new_state: RoomState) -> bool:
         """Validate state transition."""
-        valid_transitions = {
-            RoomState.VACANT: [RoomState.OCCUPIED],
-            RoomState.OCCUPIED: [RoomState.DETECTION_TIMEOUT, RoomState.VACANT],
-            RoomState.DETECTION_TIMEOUT: [RoomState.OCCUPIED, RoomState.COUNTDOWN],
-            RoomState.COUNTDOWN: [RoomState.OCCUPIED, RoomState.VACANT],
-        }
-
-        if new_state not in valid_transitions[self._state]:
+        if (self._state, new_state) not in VALID_TRANSITIONS:
             logPresenceControl.warning(
                 "Invalid state transition attempted: %s -> %s",
-                self._state.value,
-                new_state.value,
+                ROOM_STATE_NAMES[self._state],
+                ROOM_STATE_NAMES[new_state],
             )
             return False
         return True
 
-    async def handle_detection_timeout(self) -> None:
-        """Handle detection timeout completion."""
-        if self.state == RoomState.DETECTION_TIMEOUT:
-            if self.coordinator.light_controller.check_any_lights_on(
-                self.active_lights
-            ):
-                logPresenceControl.debug(
-                    "Detection timeout expired, starting countdown"
-                )
-                await self._update_state(RoomState.COUNTDOWN)
-                self._start_countdown_timer()
-            else:
-                logPresenceControl.debug(
-                    "Detection timeout expired, all lights off - room is vacant"
-                )
-                await self._update_state(RoomState.VACANT)
-
     # 4. Timer Management
+    @callback
+    def async_unload(self) -> None:
+        """Stop all timers when the config entry is unloaded."""
+        self._cancel_timers()
+        PresenceTimerManager.get(self.hass).discard_stale()
+
+    @callback
+    def _cancel_timer(self, kind: str) -> None:
+        """Cancel a single timer."""
+        self._timers[kind].cancel()
+
+    @callback
+    def _start_timer(self, kind: str, duration: float) -> None:
+        """Start (or restart) a single timer."""
+        self._timers[kind].start(duration)
+
     @callback
     def _cancel_timers(self) -> None:
         """Cancel all active timers."""
-        self._detection_timer.cancel()
-        self._countdown_timer.cancel()
-        logPresenceControl.debug("All timers cancelled")
+        timers = self._timers.values()
+        if not any(timer.is_active for timer in timers):
+            return
+        for timer in timers:
+            timer.cancel()
+        if logPresenceControl.isEnabledFor(logging.DEBUG):
+            logPresenceControl.debug("All timers cancelled")
 
     @callback
     def _start_detection_timer(self) -> None:
         """Start the detection timeout timer."""
-        self._detection_timer.start(self.coordinator.detection_timeout)
+        self._start_timer(TIMER_DETECTION, self.coordinator.detection_timeout)
 
     @callback
     def _start_countdown_timer(self, subtract_detection: bool = True) -> None:
@@ -379,94 +649,150 @@ class PresenceControl:
             subtract_detection: If True, starts counting from where detection_timeout left off.
                                 If False, uses full countdown duration.
         """
-        timeout = (
-            self.coordinator.short_timeout
-            if self.coordinator.has_night_mode
-            and self.coordinator.data.get("binary_sensor_night_mode", False)
-            else self.coordinator.long_timeout
-        )
+        self._countdown_subtracts_detection = subtract_detection
+        timeout = self._countdown_duration(subtract_detection)
+        if timeout <= 0:
+            # Detection timeout already covered the countdown; finish now
+            # rather than leaving the room stuck in COUNTDOWN
+            self._cancel_timer(TIMER_COUNTDOWN)
+            self.hass.async_create_task(self._timer_finished(TIMER_COUNTDOWN))
+            return
 
-        if subtract_detection:
-            timeout = timeout - self.coordinator.detection_timeout
+        self._start_timer(TIMER_COUNTDOWN, timeout)
 
-        self._countdown_timer.start(timeout)
+    def _countdown_duration(self, subtract_detection: bool = True) -> float:
+        """Get the countdown duration for the current mode."""
+        coordinator = self.coordinator
+        timeout = coordinator.countdown_timeout
+        if subtract_detection:
+            timeout -= coordinator.detection_timeout
+        return timeout
 
     async def start_countdown_from_vacant(self) -> None:
         """Start countdown timer when a light is turned on while vacant."""
         await self._update_state(RoomState.COUNTDOWN)
         self._start_countdown_timer(subtract_detection=False)
 
-    async def _detection_timer_finished(self, _now) -> None:
-        """Handle detection timer completion."""
-        if self._state == RoomState.DETECTION_TIMEOUT:
-            await self.handle_detection_timeout()
-
-    async def _countdown_timer_finished(self, _now) -> None:
-        """Handle countdown timer completion."""
-        if self._state == RoomState.COUNTDOWN:
+    async def _timer_finished(self, kind: str) -> None:
+        """Handle timer completion."""
+        if self._state != TIMER_STATES[kind]:
+            return
+        if kind == TIMER_COUNTDOWN:
             logPresenceControl.debug("Countdown finished, transitioning to vacant")
             await self._update_state(RoomState.VACANT)
+            return
+
+        coordinator = self.coordinator
+        if coordinator.light_controller.check_any_lights_on(coordinator.active_lights):
+            logPresenceControl.debug("Detection timeout expired, starting countdown")
+            await self._update_state(RoomState.COUNTDOWN)
+            self._start_countdown_timer()
+        else:
+            logPresenceControl.debug(
+                "Detection timeout expired, all lights off - room is vacant"
+            )
+            await self._update_state(RoomState.VACANT)
 
-    async def update_timers(self, control_type: str, key: str) -> None:
-        """Update running timers when control values change."""
+    def _timer_unchanged(self, kind: str, duration: float) -> bool:
+        """Check if a running timer was already started with duration."""
+        timer = self._timers[kind]
+        return timer.is_active and timer.duration == duration
+
+    @callback
+    def update_timers(self) -> None:
+        """Restart the running timer if its configured duration changed."""
         try:
-            if (
-                self._state == RoomState.DETECTION_TIMEOUT
-                and key == "detection_timeout"
-            ):
-                logPresenceControl.debug(
-                    "Updating detection timer: %s seconds",
-                    self.coordinator.detection_timeout,
-                )
+            if self._state == RoomState.DETECTION_TIMEOUT:
+                duration = self.coordinator.detection_timeout
+                if self._timer_unchanged(TIMER_DETECTION, duration):
+                    return
+                if logPresenceControl.isEnabledFor(logging.DEBUG):
+                    logPresenceControl.debug(
+                        "Updating detection timer: %s seconds", duration
+                    )
                 self._start_detection_timer()
-            elif self._state == RoomState.COUNTDOWN and key in [
-                "long_timeout",
-                "short_timeout",
-            ]:
-                timeout = (
-                    self.coordinator.short_timeout
-                    if self.coordinator.data.get("binary_sensor_night_mode", False)
-                    else self.coordinator.long_timeout
-                )
-                logPresenceControl.debug(
-                    "Updating countdown timer: %s seconds",
-                    timeout,
-                )
-                self._start_countdown_timer()
-        except (HomeAssistantError, ServiceNotFound) as err:
-            logPresenceControl.warning(
-                "Error updating timers for %s.%s: %s",
-                control_type,
-                key,
-                err,
-            )
+            elif self._state == RoomState.COUNTDOWN:
+                subtract_detection = self._countdown_subtracts_detection
+                duration = self._countdown_duration(subtract_detection)
+                if self._timer_unchanged(TIMER_COUNTDOWN, duration):
+                    return
+                if logPresenceControl.isEnabledFor(logging.DEBUG):
+                    logPresenceControl.debug(
+                        "Updating countdown timer: %s seconds", duration
+                    )
+                self._start_countdown_timer(subtract_detection)
+        except SERVICE_ERRORS as err:
+            logPresenceControl.warning("Error updating timers: %s", err)
 
     # 5. Event Handlers
-    async def handle_presence_event(self, event) -> None:
-        """Handle presence sensor state changes."""
-        new_state = event.data.get("new_state")
+    @callback
+    def handle_presence_event(self, event) -> None:
+        """Handle presence sensor state changes.
+
+        Runs inline in the event loop; a task is only created when the
+        state machine actually has to transition. Bursts of ON/OFF flaps are
+        coalesced so only the last state within the debounce window reaches
+        the state machine. The first detection in a vacant room is never
+        delayed.
+        """
+        data = event.data
+        new_state = data["new_state"]
         if new_state is None:
             return
 
+        presence_state = new_state.state
+        old_state = data["old_state"]
+        if old_state is not None and old_state.state == presence_state:
+            # Attribute-only update (e.g. mmWave distance); nothing changed
+            return
+
+        if self._state == RoomState.OCCUPIED and presence_state == "on":
+            # Motion re-triggering in an occupied room: nothing to transition,
+            # and any pending "off" from the same burst is superseded
+            self._presence_debouncer.async_cancel()
+            self._pending_presence_state = None
+            self._last_presence_time = self._clock()
+            return
+
+        if self._state == RoomState.VACANT:
+            self._presence_debouncer.async_cancel()
+            self._pending_presence_state = None
+            if presence_state != "on":
+                # Losing presence while vacant never transitions
+                return
+            self._pending_presence_state = presence_state
+            self.hass.async_create_task(self._async_process_presence_state())
+            return
+
+        self._pending_presence_state = presence_state
+        self._presence_debouncer.async_schedule_call()
+
+    async def _async_process_presence_state(self) -> None:
+        """Feed the latest pending presence state into the state machine."""
+        presence_state = self._pending_presence_state
+        if presence_state is None:
+            return
+        self._pending_presence_state = None
+
         try:
-            if new_state.state == "on":
+            if presence_state == "on":
                 await self._on_presence_sensor_activated()
             else:
                 await self._on_presence_sensor_deactivated()
-        except (HomeAssistantError, ServiceNotFound) as err:
+        except SERVICE_ERRORS as err:
             logPresenceControl.warning("Error handling presence event: %s", err)
 
     async def _on_presence_sensor_activated(self) -> None:
         """Handle presence sensor activation."""
-        self._last_presence_time = dt_util.utcnow()
+        now = self._last_presence_time = self._clock()
         if self._state != RoomState.OCCUPIED:
-            self._occupancy_start_time = self._last_presence_time
-            await self._update_state(RoomState.OCCUPIED)
+            self._cancel_timers()
+            await self._update_state(RoomState.OCCUPIED, now)
 
     async def _on_presence_sensor_deactivated(self) -> None:
         """Handle presence sensor deactivation."""
-        self._last_presence_time = dt_util.utcnow()
         if self._state == RoomState.OCCUPIED:
+            self._last_presence_time = self._clock()
             await self._update_state(RoomState.DETECTION_TIMEOUT)
             self._start_detection_timer()
 
@@ -475,4 +801,5 @@ class PresenceControl:
         if state == "on":
             await self._on_presence_sensor_activated()
         else:
-            await self._on_presence_sensor_deactivated()
+            # Start counting absence from startup
+            self._last_presence_time = self._clock()
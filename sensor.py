@@ -9,7 +9,7 @@ from homeassistant.components.sensor import (
 )
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import UnitOfTime, LIGHT_LUX
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
@@ -18,6 +18,27 @@ from .const import (
 )
 from .coordinator import DynamicPresenceCoordinator
 
+# Sensor key -> (device class, state class, unit of measurement)
+SENSOR_META: dict[str, tuple[SensorDeviceClass, SensorStateClass, str]] = {
+    "occupancy_duration": (
+        SensorDeviceClass.DURATION,
+        SensorStateClass.MEASUREMENT,
+        UnitOfTime.SECONDS,
+    ),
+    "absence_duration": (
+        SensorDeviceClass.DURATION,
+        SensorStateClass.MEASUREMENT,
+        UnitOfTime.SECONDS,
+    ),
+    "light_level": (
+        SensorDeviceClass.ILLUMINANCE,
+        SensorStateClass.MEASUREMENT,
+        LIGHT_LUX,
+    ),
+}
+SENSOR_KEYS_BASE = ("occupancy_duration", "absence_duration")
+SENSOR_KEYS_LIGHT_SENSOR = ("light_level",)
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -27,49 +48,24 @@ async def async_setup_entry(
     """Set up sensors from a config entry."""
     coordinator: DynamicPresenceCoordinator = hass.data[DOMAIN][entry.entry_id]
 
+    keys = SENSOR_KEYS_BASE
+    # Only add light level sensor if a light sensor is configured
+    if coordinator.has_light_sensor:
+        keys += SENSOR_KEYS_LIGHT_SENSOR
+
     entities: list[SensorEntity] = [
         DynamicPresenceSensor(
             coordinator=coordinator,
-            device_class=SensorDeviceClass.DURATION,
-            state_class=SensorStateClass.MEASUREMENT,
-            native_unit_of_measurement=UnitOfTime.SECONDS,
-            unique_id=f"{entry.entry_id}_occupancy_duration",
-            key="occupancy_duration",
-        ),
-        DynamicPresenceSensor(
-            coordinator=coordinator,
-            device_class=SensorDeviceClass.DURATION,
-            state_class=SensorStateClass.MEASUREMENT,
-            native_unit_of_measurement=UnitOfTime.SECONDS,
-            unique_id=f"{entry.entry_id}_absence_duration",
-            key="absence_duration",
-        ),
-        ManualStatesSensor(
-            coordinator=coordinator,
-            is_night_mode=False,
-        ),
+            unique_id=f"{entry.entry_id}_{key}",
+            key=key,
+        )
+        for key in keys
     ]
+    entities.append(ManualStatesSensor(coordinator=coordinator, is_night_mode=False))
 
     # Only add night mode sensor if night lights are configured
     if coordinator.has_night_mode:
-        entities.append(
-            ManualStatesSensor(
-                coordinator=coordinator,
-                is_night_mode=True,
-            )
-        )
-
-    if coordinator.has_light_sensor:
-        entities.append(
-            DynamicPresenceSensor(
-                coordinator=coordinator,
-                device_class=SensorDeviceClass.ILLUMINANCE,
-                state_class=SensorStateClass.MEASUREMENT,
-                native_unit_of_measurement=LIGHT_LUX,
-                unique_id=f"{entry.entry_id}_light_level",
-                key="light_level",
-            )
-        )
+        entities.append(ManualStatesSensor(coordinator=coordinator, is_night_mode=True))
 
     async_add_entities(entities)
 
@@ -85,29 +81,46 @@ class DynamicPresenceSensor(
     def __init__(
         self,
         coordinator: DynamicPresenceCoordinator,
-        device_class: SensorDeviceClass | None,
-        state_class: SensorStateClass,
         unique_id: str,
         key: str,
-        native_unit_of_measurement: str | None = None,
     ) -> None:
         """Initialize the sensor."""
         super().__init__(coordinator)
+        device_class, state_class, native_unit_of_measurement = SENSOR_META[key]
         self._attr_device_class = device_class
         self._attr_state_class = state_class
         self._attr_unique_id = unique_id
         self._attr_suggested_object_id = key
         self._attr_translation_key = key
         self._key = key
+        self._data_key = f"sensor_{key}"
         self._attr_native_unit_of_measurement = native_unit_of_measurement
         self._attr_device_info = coordinator.device_info
+        # Last (availability, value) written to the state machine
+        self._last_written: tuple[bool, int | float | None] | None = None
+
+    async def async_added_to_hass(self) -> None:
+        """Record the state written when the sensor is added."""
+        await super().async_added_to_hass()
+        # The platform writes the initial state right after this returns
+        self._last_written = (self.available, self.native_value)
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write state only when this sensor's value or availability changed."""
+        written = (self.available, self.native_value)
+        if written == self._last_written:
+            return
+        self._last_written = written
+        self.async_write_ha_state()
 
     @property
     def native_value(self) -> int | float | None:
         """Return the state of the sensor."""
-        if self.coordinator.data is None:
+        data = self.coordinator.data
+        if data is None:
             return None
-        return self.coordinator.data.get(f"sensor_{self._key}", 0)
+        return data.get(self._data_key, 0)
 
 
 class ManualStatesSensor(CoordinatorEntity[DynamicPresenceCoordinator], SensorEntity):
@@ -123,35 +136,34 @@ class ManualStatesSensor(CoordinatorEntity[DynamicPresenceCoordinator], SensorEn
     ) -> None:
         """Initialize the sensor."""
         super().__init__(coordinator)
-        self._is_night_mode = is_night_mode
+        self._mode = "night" if is_night_mode else "main"
+        # Display names derived from light entity IDs, filled on first use
+        self._light_names: dict[str, str] = {}
+
+        key = f"{self._mode}_manual_states"
 
         # Set unique_id and entity_id
-        self._attr_unique_id = (
-            f"{coordinator.entry.entry_id}_"
-            f"{'night' if is_night_mode else 'main'}_manual_states"
-        )
-        self.entity_id = (
-            f"sensor.{coordinator.room_name}_"
-            f"{'night' if is_night_mode else 'main'}_manual_states"
-        ).lower()
+        self._attr_unique_id = f"{coordinator.entry.entry_id}_{key}"
+        self.entity_id = f"sensor.{coordinator.room_name}_{key}".lower()
 
         # Set name based on mode
-        self._attr_translation_key = (
-            "night_manual_states" if is_night_mode else "main_manual_states"
-        )
+        self._attr_translation_key = key
         self._attr_device_info = coordinator.device_info
 
     @property
     def native_value(self) -> str:
         """Return the state of the sensor."""
-        states = self.coordinator.manual_states
-        mode_states = states["night" if self._is_night_mode else "main"]
+        mode_states = self.coordinator.manual_states[self._mode]
+        light_names = self._light_names
 
         # Format each light state as "Light Name: ON/OFF"
         formatted_states = []
         for entity_id, is_on in mode_states.items():
-            # Extract light name from entity_id (e.g., "light.kitchen" -> "Kitchen")
-            light_name = entity_id.split(".")[-1].replace("_", " ").title()
+            light_name = light_names.get(entity_id)
+            if light_name is None:
+                # Extract light name from entity_id (e.g., "light.kitchen" -> "Kitchen")
+                light_name = entity_id.rsplit(".", 1)[-1].replace("_", " ").title()
+                light_names[entity_id] = light_name
             state_str = "ON" if is_on else "OFF"
             formatted_states.append(f"{light_name}: {state_str}")
 
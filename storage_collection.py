@@ -3,8 +3,9 @@
 from dataclasses import dataclass
 import logging
 from typing import Any
+from weakref import WeakValueDictionary
 
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers import storage
 from homeassistant.helpers.storage import Store
 
@@ -13,11 +14,16 @@ from .const import DOMAIN, STORAGE_VERSION
 logStorage = logging.getLogger(__name__)
 
 # Data type constants
-RUNTIME_PREFIXES = ["switch_", "binary_sensor_", "sensor_"]
-CONFIG_PREFIXES = ["number_", "time_"]
+RUNTIME_PREFIXES = ("switch_", "binary_sensor_", "sensor_")
 
+# Seconds to coalesce state changes before writing them to disk
+SAVE_DELAY = 10
 
-@dataclass
+# Store instances by entry ID, dropped once no storage object holds them
+_STORE_CACHE: WeakValueDictionary[str, Store] = WeakValueDictionary()
+
+
+@dataclass(slots=True)
 class DynamicPresenceStorageData:
     """Dynamic Presence storage data."""
 
@@ -33,13 +39,18 @@ class DynamicPresenceStorage:
         """Initialize the storage."""
         self.hass = hass
         self.entry_id = entry_id
-        self.storage: Store = storage.Store(
-            hass,
-            STORAGE_VERSION,
-            f"{DOMAIN}.{entry_id}",
-            private=True,
-            atomic_writes=True,
-        )
+        # Reuse the entry's Store across reloads so a pending delayed write
+        # from the previous instance is not raced by a second Store
+        store = _STORE_CACHE.get(entry_id)
+        if store is None:
+            store = _STORE_CACHE[entry_id] = storage.Store(
+                hass,
+                STORAGE_VERSION,
+                f"{DOMAIN}.{entry_id}",
+                private=True,
+                atomic_writes=True,
+            )
+        self.storage: Store = store
         self._data: DynamicPresenceStorageData | None = None
 
     @property
@@ -52,23 +63,9 @@ class DynamicPresenceStorage:
     # 2. State Type Validation
     def is_runtime_state(self, key: str) -> bool:
         """Check if key represents a runtime state."""
-        return any(key.startswith(prefix) for prefix in RUNTIME_PREFIXES)
-
-    def is_config_value(self, key: str) -> bool:
-        """Check if key represents a configuration value."""
-        return any(key.startswith(prefix) for prefix in CONFIG_PREFIXES)
+        return key.startswith(RUNTIME_PREFIXES)
 
     # 3. Data Access
-    def get_config_value(self, key: str) -> Any:
-        """Get a configuration value.
-
-        Raises:
-            ValueError: If key is not a configuration value
-        """
-        if not self.is_config_value(key):
-            raise ValueError(f"Key {key} is not a configuration value")
-        return self.data.states.get(key)
-
     def get_state(self, key: str) -> Any:
         """Get a state value from storage."""
         return self.data.states.get(key)
@@ -95,7 +92,7 @@ class DynamicPresenceStorage:
         Raises:
             ValueError: If key is not a valid state type
         """
-        if not (self.is_runtime_state(key) or self.is_config_value(key)):
+        if not self.is_runtime_state(key):
             raise ValueError(f"Invalid state key: {key}")
         logStorage.debug("Setting state %s = %s", key, value)
         self.data.states[key] = value
@@ -108,6 +105,9 @@ class DynamicPresenceStorage:
     # 5. Storage Operations
     async def async_load(self) -> dict | None:
         """Load the storage data."""
+        if self._data is not None:
+            return self._data.manual_states
+
         stored = await self.storage.async_load()
 
         # Extract data with defaults if storage is empty or incomplete
@@ -125,13 +125,23 @@ class DynamicPresenceStorage:
 
         return manual_states
 
+    def _data_to_save(self) -> dict[str, Any]:
+        """Return the data to write to storage."""
+        return {"states": self._data.states, "manual_states": self._data.manual_states}
+
     async def async_save(self) -> None:
         """Save data to storage."""
         if self._data is None:
             return
 
-        await self.storage.async_save(
-            {"states": self._data.states, "manual_states": self._data.manual_states}
-        )
+        await self.storage.async_save(self._data_to_save())
 
         logStorage.debug("Saved storage data for %s: %s", self.entry_id, self._data)
+
+    @callback
+    def async_schedule_save(self) -> None:
+        """Schedule a save, coalescing changes made within SAVE_DELAY."""
+        if self._data is None:
+            return
+
+        self.storage.async_delay_save(self._data_to_save, SAVE_DELAY)
@@ -20,6 +20,9 @@ from .const import (
 )
 from .coordinator import DynamicPresenceCoordinator
 
+SWITCH_KEYS_BASE = (CONF_AUTOMATION, CONF_AUTO_ON, CONF_AUTO_OFF)
+SWITCH_KEYS_NIGHT_MODE = (CONF_NIGHT_MODE, CONF_NIGHT_MANUAL_ON)
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -29,42 +32,19 @@ async def async_setup_entry(
     """Set up switches from a config entry."""
     coordinator: DynamicPresenceCoordinator = hass.data[DOMAIN][entry.entry_id]
 
-    entities = [
-        DynamicPresenceSwitch(
-            coordinator=coordinator,
-            unique_id=f"{entry.entry_id}_{CONF_AUTOMATION}",
-            key=CONF_AUTOMATION,
-        ),
-        DynamicPresenceSwitch(
-            coordinator=coordinator,
-            unique_id=f"{entry.entry_id}_{CONF_AUTO_ON}",
-            key=CONF_AUTO_ON,
-        ),
-        DynamicPresenceSwitch(
-            coordinator=coordinator,
-            unique_id=f"{entry.entry_id}_{CONF_AUTO_OFF}",
-            key=CONF_AUTO_OFF,
-        ),
-    ]
-
+    keys = SWITCH_KEYS_BASE
     # Only add night mode switches if night mode is configured
     if coordinator.has_night_mode:
-        entities.extend(
-            [
-                DynamicPresenceSwitch(
-                    coordinator=coordinator,
-                    unique_id=f"{entry.entry_id}_{CONF_NIGHT_MODE}",
-                    key=CONF_NIGHT_MODE,
-                ),
-                DynamicPresenceSwitch(
-                    coordinator=coordinator,
-                    unique_id=f"{entry.entry_id}_{CONF_NIGHT_MANUAL_ON}",
-                    key=CONF_NIGHT_MANUAL_ON,
-                ),
-            ]
-        )
+        keys += SWITCH_KEYS_NIGHT_MODE
 
-    async_add_entities(entities)
+    async_add_entities(
+        DynamicPresenceSwitch(
+            coordinator=coordinator,
+            unique_id=f"{entry.entry_id}_{key}",
+            key=key,
+        )
+        for key in keys
+    )
 
 
 class DynamicPresenceSwitch(
@@ -87,22 +67,16 @@ class DynamicPresenceSwitch(
         self._attr_suggested_object_id = key
         self._attr_translation_key = key
         self._key = key
+        self._data_key = f"switch_{key}"
         self._attr_device_info = coordinator.device_info
 
     @property
     def is_on(self) -> bool | None:
         """Return True if entity is on."""
-        if self.coordinator.data is None:
+        data = self.coordinator.data
+        if data is None:
             return None
-        return self.coordinator.data.get(f"switch_{self._key}", False)
-
-    def turn_on(self, **kwargs) -> None:
-        """Turn the entity on."""
-        self.hass.async_create_task(self.async_turn_on(**kwargs))
-
-    def turn_off(self, **kwargs) -> None:
-        """Turn the entity off."""
-        self.hass.async_create_task(self.async_turn_off(**kwargs))
+        return data.get(self._data_key, False)
 
     async def async_turn_on(self, **kwargs) -> None:
         """Turn the entity on."""